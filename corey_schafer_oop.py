@@ -1,6 +1,63 @@
 # Python OOP
 
 import datetime
+import sys
+from collections import deque
+from itertools import count, islice, repeat
+from operator import attrgetter
+
+"""numpy and numba are optional. They are only used to speed up working with
+many employees at once, so the rest of the file still runs without them.
+numba takes a long time to import, so it is only imported the first time a
+large batch of raises is applied (see _load_scale_pay).
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+numba = None
+_scale_pay = None  # The compiled function, or False if numba isn't available
+
+"""apply_raise_batch only uses numba for at least this many employees. For
+smaller lists, copying the pays into an array and starting numba's threads
+costs more than simply looping over the employees.
+"""
+_MIN_BATCH_SIZE = 10_000
+
+"""The largest pay, after its raise, that apply_raise_batch hands to numba.
+It is kept well below the 64-bit integer limit so that rounding in the
+multiplication can never overflow.
+"""
+_MAX_BATCH_PAY = 2.0 ** 62
+
+
+def _scale_pay_py(pay, factor):
+    """Multiplies every pay in the array by factor in place. Numba compiles
+    this to machine code and splits the loop across CPU cores with prange.
+    """
+    for i in numba.prange(pay.shape[0]):
+        pay[i] = np.int64(pay[i] * factor)
+    return pay
+
+
+def _load_scale_pay():
+    """Imports numba and compiles _scale_pay_py the first time it is called,
+    then returns the compiled function. cache=True saves the compiled code to
+    disk so later runs of the program don't have to compile it again. Returns
+    None if numpy or numba aren't installed.
+    """
+    global numba, _scale_pay
+    if _scale_pay is None:
+        try:
+            import numba
+        except ImportError:
+            numba = None
+        if np is None or numba is None:
+            _scale_pay = False
+        else:
+            _scale_pay = numba.njit(parallel=True, cache=True)(_scale_pay_py)
+    return _scale_pay or None
 
 
 class Employee:
@@ -19,6 +76,19 @@ class Employee:
     """
     num_of_employees = 0
     raise_amount = 1.04
+    _id_counter = count(1)  # Hands out the numbers used by num_of_employees
+
+    """__slots__ declares the only instance attributes an Employee can have.
+    Instead of giving every instance its own __dict__, Python reserves a fixed
+    space for each named attribute. This saves memory when lots of instances
+    are created and makes reading the attributes a little faster. Class
+    variables such as raise_amount are not listed here because they belong to
+    the class, not the instance.
+
+    _names holds the cached results of the fullname and email properties,
+    along with the first and last names they were built from.
+    """
+    __slots__ = ('first', 'last', 'pay', '_names')
 
     def __init__(self, first, last, pay):
         """The __init__ method is used to initialise an object in python when
@@ -30,29 +100,127 @@ class Employee:
         """
 
         # Assigning attributes to the instance of the class
-        self.first = first
-        self.last = last
+        # sys.intern makes every employee with the same name share one string
+        # object instead of each storing its own copy. It only accepts plain
+        # str objects, so the names are converted with str() first.
+        self.first = sys.intern(str(first))
+        self.last = sys.intern(str(last))
         self.pay = pay
+        self._names = None  # Nothing cached yet
         # self.email = f"{first}.{last}@company.com"
         # Email changed to a @property at the end of the class
 
-        """Incrementing the class variable `num_of_employees` by 1 each time a 
-        new Employee class is initialised. This 
+        """Updating the class variable `num_of_employees` each time a new
+        Employee class is initialised. Rather than `num_of_employees += 1`,
+        which reads the old value, adds one and stores it back, the next number
+        is taken from the itertools.count in `_id_counter` in a single call
+        into C. Each new employee gets a different number, but if two threads
+        create employees at the same moment, num_of_employees may briefly show
+        the smaller of the two until the next employee is created.
         """
-        Employee.num_of_employees += 1
+        Employee.num_of_employees = next(Employee._id_counter)
 
+    @property
     def fullname(self):
         """A "regular method" for a class. These ALWAYS take the instance as
         the first argument, in this case that is `self`. These methods are
         used to access or modify the data or attributes for an instance of
         a class.
+
+        fullname has since been given a @property decorator so that its result
+        can be cached. The name is built the first time it is accessed and
+        stored by _cached_names together with the first and last it was built
+        from. Later accesses return the stored name as long as first and last
+        are still the same objects, so changing either name is picked up
+        automatically. functools.cached_property can't be used here because it
+        stores its result in the instance __dict__, which a class with
+        __slots__ doesn't have.
         """
-        return f"{self.first} {self.last}"
+        return self._cached_names()[2]
+
+    def _cached_names(self):
+        """Returns the cached (first, last, fullname, email) record, building
+        a new one if first or last has changed since it was made. fullname and
+        email share this one tuple in the _names slot, so caching both costs
+        an instance a single extra object rather than one for each.
+
+        first and last are read into local variables once and reused.
+        """
+        first, last = self.first, self.last
+        names = self._names
+        if names is None or names[0] is not first or names[1] is not last:
+            names = self._names = (first, last, first + ' ' + last,
+                                   first + '.' + last + '@company.com')
+        return names
 
     def apply_raise(self):
         """A "regular method" using a class variable to modify an attribute.
+
+        raise_amount is read from type(self) and kept in a local variable, so
+        Python looks it up on the class once instead of checking the instance
+        first. As instances have __slots__, they can't have their own
+        raise_amount anyway.
         """
-        self.pay = int(self.pay * self.raise_amount)
+        raise_amount = type(self).raise_amount
+        self.pay = int(self.pay * raise_amount)
+
+    @classmethod
+    def apply_raise_batch(cls, employees):
+        """A class method that gives a whole list of employees a raise at once.
+        The result is the same as calling apply_raise on each employee, so each
+        employee is raised by their own class's raise_amount even when the list
+        mixes Employees and Developers.
+
+        For large lists the employees are grouped by class and each group's
+        pays are copied into a numpy array, raised by the compiled _scale_pay
+        function and then written back, instead of calling apply_raise on each
+        employee one at a time. Only the pays are passed to numba, not the
+        Employee objects, because numba is much slower at handling Python
+        objects than plain numbers. map, attrgetter and setattr read and write
+        the pays without a Python loop body.
+
+        numba only handles 64-bit integers. numpy picks int64 for the array
+        only if every pay is an int that fits, so when it picks anything else,
+        or a pay is too large to raise safely, the employees with those pays
+        are passed to apply_raise instead. Groups smaller than _MIN_BATCH_SIZE,
+        or any list when numpy or numba aren't installed, also just use
+        apply_raise.
+        """
+        employees = list(employees)
+        scale_pay = None
+        if len(employees) >= _MIN_BATCH_SIZE:
+            scale_pay = _load_scale_pay()
+        if scale_pay is None:
+            for employee in employees:
+                employee.apply_raise()
+            return
+
+        get_pay = attrgetter('pay')
+        classes = set(map(type, employees))
+        for klass in classes:
+            if len(classes) == 1:
+                group = employees
+            else:
+                group = [e for e in employees if type(e) is klass]
+            factor = klass.raise_amount
+            limit = _MAX_BATCH_PAY / max(abs(factor), 1)
+            pay = np.array(list(map(get_pay, group)))
+            if pay.dtype != np.int64 or np.abs(pay).max() >= limit:
+                # Some pays can't go through numba, so pick out those that can
+                batch = []
+                for employee in group:
+                    if type(employee.pay) is int and abs(employee.pay) < limit:
+                        batch.append(employee)
+                    else:
+                        employee.apply_raise()
+                group = batch
+                pay = np.array(list(map(get_pay, group)), dtype=np.int64)
+            if len(group) < _MIN_BATCH_SIZE:
+                for employee in group:
+                    employee.apply_raise()
+                continue
+            scale_pay(pay, factor)
+            deque(map(setattr, group, repeat('pay'), pay.tolist()), maxlen=0)
 
     @classmethod
     def set_raise_amount(cls, amount):
@@ -75,9 +243,54 @@ class Employee:
         by a hyphen instead of being separate variables. This alternative
         constructor will split the employee details into separate variables and
         return a newly created instance of the class.
+
+        str.partition splits on the first hyphen only and always returns a
+        3-tuple, so no intermediate list is built. pay is converted to an int
+        so that apply_raise works on a number rather than a string.
         """
-        first, last, pay = employee_string.split('-')
-        return cls(first, last, pay)
+        first, _, rest = employee_string.partition('-')
+        last, _, pay = rest.partition('-')
+        return cls(first, last, int(pay))
+
+    """_bulk_init lets a subclass set its own extra attributes from each row
+    in bulk_create. It is None here because an Employee has nothing extra to
+    set.
+    """
+    _bulk_init = None
+
+    @classmethod
+    def bulk_create(cls, rows):
+        """Another alternative constructor, for creating a large number of
+        employees at once. rows is an iterable of (first, last, pay) tuples,
+        with any extra items a subclass needs after them.
+
+        Each instance is allocated with cls.__new__ and its slots are filled
+        in directly, doing the same work as __init__ without calling it for
+        every row. If the class has a _bulk_init method, it is called with
+        each new instance and its row to set the subclass' attributes.
+
+        Numbers are only taken from the shared counter once every row has been
+        built, so a bad row part way through doesn't use any up. islice takes
+        them all in a single call and num_of_employees is updated once.
+        """
+        new = cls.__new__
+        intern = sys.intern
+        bulk_init = cls._bulk_init
+        employees = []
+        append = employees.append
+        for row in rows:
+            employee = new(cls)
+            employee.first = intern(str(row[0]))
+            employee.last = intern(str(row[1]))
+            employee.pay = row[2]
+            employee._names = None
+            if bulk_init is not None:
+                bulk_init(employee, row)
+            append(employee)
+        if employees:
+            Employee.num_of_employees = next(
+                islice(Employee._id_counter, len(employees) - 1, None))
+        return employees
 
     @staticmethod
     def is_workday(day):
@@ -89,9 +302,7 @@ class Employee:
         In this example, using the datetime package to determine if a date is
         a workday (Mon-Fri).
         """
-        if day.weekday() == 5 or day.weekday() == 6:  # 5 is Sat, 6 is Sun
-            return False
-        return True
+        return day.weekday() < 5  # 0-4 is Mon-Fri, 5 is Sat, 6 is Sun
 
     """Below are examples of Special/Magic/Dunder methods. All different names
     for the same thing. These methods are used to define how built-in Python 
@@ -110,8 +321,12 @@ class Employee:
 
         This example in particular will return a line of code to instantiate
         an Employee class and recreate the object.
+
+        %-formatting is used here instead of an f-string as it is slightly
+        cheaper for a method that may be called a lot while logging.
         """
-        return f"Employee({self.first}, {self.last}, {self.pay})"
+        first, last = self.first, self.last
+        return "Employee(%s, %s, %s)" % (first, last, self.pay)
 
     def __str__(self):
         """The __str__ method is meant to be used as a display for the end user
@@ -120,7 +335,7 @@ class Employee:
         This particular example will return readable information about the
         employee.
         """
-        return f"{self.fullname()} - {self.email}"
+        return f"{self.fullname} - {self.email}"
 
     @property
     def email(self):
@@ -134,26 +349,36 @@ class Employee:
         If a method was created without the @property decorator, then you would
         have to put parenthesis at the end of each call in the code which would
         be prone to errors, simply missing one.
+
+        Like fullname, the email is cached and rebuilt when first or last is
+        changed.
         """
-        return f"{self.first}.{self.last}@company.com"
+        return self._cached_names()[3]
 
     @property
     def name_change(self):
         """The original tutorial stripped down a lot of code and changed the
         fullname method to include a @property decorator. I didn't want to
         do that because I wanted to preserve the original , so I have created a new method.
+        fullname has since become a cached @property, so this getter simply
+        returns it.
         """
-        return f"{self.first} {self.last}"
+        return self.fullname
 
     @name_change.setter
     def name_change(self, name):
         """A method with the @setter decorator must have the same name as the
         method with the @property decorator. This method is used to "set" the
         attributes in the @property decorator.
+
+        The new names are interned like in __init__. str.split always returns
+        plain str objects, so they don't need converting first. The cached
+        fullname and email notice the new names and are rebuilt on their next
+        access.
         """
         first, last = name.split(" ")
-        self.first = first
-        self.last = last
+        self.first = sys.intern(first)
+        self.last = sys.intern(last)
 
 
 class Developer(Employee):
@@ -170,6 +395,11 @@ class Developer(Employee):
     """
     raise_amount = 1.10
 
+    """Subclasses only list the attributes they add. The slots declared in
+    Employee are inherited, so redeclaring them here would waste memory.
+    """
+    __slots__ = ('prog_lang',)
+
     def __init__(self, first, last, pay, prog_lang):
         """Creating an __init__ method for the subclass. In this example the
         __init__ method is the same as the superclass but with the added
@@ -180,137 +410,252 @@ class Developer(Employee):
         super().__init__(first, last, pay)
         self.prog_lang = prog_lang
 
+    def _bulk_init(self, row):
+        """Called by the superclass' bulk_create for each new developer. Each
+        row has prog_lang as a fourth item.
+        """
+        self.prog_lang = row[3]
+
 
 class Manager(Employee):
     """Another example of a subclass"""
 
+    __slots__ = ('employees',)
+
     def __init__(self, first, last, pay, employees=None):
         """This __init__ method passes in a list, the contents are unimportant.
         What is important is a list is a mutable object, and in this particular
         case has a default value of None. This needs to be checked and an
         empty list created each time a new Manager class is instantiated.
+
+        The employees are stored in a dict keyed by id(employee) rather than a
+        list. Checking whether a key is in a dict, or removing one, is a single
+        hash lookup, whereas a list has to be scanned one item at a time. Dicts
+        also remember the order items were added, so print_employees still
+        prints them in the same order.
         """
         super().__init__(first, last, pay)
         if employees is None:
-            self.employees = []
+            self.employees = {}
         else:
-            self.employees = employees
+            self.employees = {id(e): e for e in employees}
+
+    def _bulk_init(self, row):
+        """Called by the superclass' bulk_create for each new manager. Every
+        manager created starts with no employees.
+        """
+        self.employees = {}
 
     def add_employee(self, employee):
-        """Method to add an employee to a supervisor."""
-        if employee not in self.employees:
-            self.employees.append(employee)
+        """Method to add an employee to a supervisor. setdefault checks for
+        the employee and adds them in a single dict lookup, so there is no
+        separate `in` check followed by an insert.
+        """
+        self.employees.setdefault(id(employee), employee)
 
     def remove_employee(self, employee):
-        """Method to remove an employee to a supervisor."""
-        if employee in self.employees:
-            self.employees.remove(employee)
+        """Method to remove an employee to a supervisor. pop with a default
+        removes the employee if they are there and does nothing otherwise,
+        again with a single lookup.
+        """
+        self.employees.pop(id(employee), None)
 
     def print_employees(self):
-        """Method to print the supervisor's employees"""
-        for employee in self.employees:
-            print(f"--> {employee.fullname()}")
-
-
-"""Creating two instances of the Employee class"""
-emp_1 = Employee("John", "Wick", 50000)
-emp_2 = Employee("Test", "User", 60000)
-
-"""Printing the the raise amounts in different ways"""
-print("Printing the raise amounts")
-print(Employee.raise_amount)  # Using the Class to access a class variable
-print(emp_1.raise_amount)  # Accessing the class variable from the instance
-print(emp_2.raise_amount)
-
-"""Modifying a class variable using a class method"""
-print("\nModifying the raise_amount class variable and printing to see the "
-      "results")
-Employee.set_raise_amount(1.05)  # Changing the raise amount to 5%
-# Printing in different ways to show the change
-print(Employee.raise_amount)
-print(emp_1.raise_amount)
-print(emp_2.raise_amount)
-
-"""Using the alternative constructor to create a new instance of the Employee 
-class"""
-print("\nUsing the alternative constructor to create new employees")
-# Creating some employee details, separated by hyphens
-emp_string_3 = "John-Doe-70000"
-emp_string_4 = "Steve-Smith-30000"
-emp_string_5 = "Jane-Doe-90000"
-
-# Using the alternative constructor to create Employee classes
-emp_3 = Employee.from_string(emp_string_3)
-emp_4 = Employee.from_string(emp_string_4)
-emp_5 = Employee.from_string(emp_string_5)
-
-# Printing details
-print(emp_3.email)
-print(emp_3.pay)
-
-"""Using the static method to check if the provided date is a workday"""
-example_date_1 = datetime.date(2022, 12, 7)  # Wednesday
-example_date_2 = datetime.date(2022, 10, 15)  # Saturday
-
-print("\nUsing the static method to check workdays")
-print(f"7/12/2022 (Wednesday): {Employee.is_workday(example_date_1)}")
-print(f"15/10/2022 (Saturday): {Employee.is_workday(example_date_2)}")
-
-"""Demonstrating the use of subclasses"""
-# Creating an instance of the Developer class
-dev_1 = Developer("Alan", "Turing", 100000, "Machine Language")
-print("\nCreating a Developer subclass and demonstrating inheritance")
-print(f"Email: {dev_1.email}")
-print(f"Programming Language: {dev_1.prog_lang}")
-
-# Using the subclass's attribute override, but using an inherited method
-print("\nRaising pay using attribute override and method inheritance")
-print(dev_1.pay)
-dev_1.apply_raise()
-print(dev_1.pay)
-
-# Creating an instance of the Manager class
-mgr_1 = Manager("Sue", "Smith", 90000, [emp_1, emp_2, emp_3])
-print("\nCreating a Manager subclass and demonstrating inheritance")
-print(f"Email: {mgr_1.email}")
-
-# Testing the Manager class methods
-print(f"\nTesting the class methods")
-mgr_1.print_employees()
-mgr_1.add_employee(dev_1)
-print("\nAdd a Developer to the team")
-mgr_1.print_employees()
-print("\nRemove an employee from the team")
-mgr_1.remove_employee(emp_1)
-mgr_1.print_employees()
-
-# Using the insintance() function
-print("\nUsing the isinstance() function")
-print(f"Is mgr_1 an employee: {isinstance(mgr_1, Employee)}")
-print(f"Is mgr_1 a manager: {isinstance(mgr_1, Manager)}")
-print(f"Is mgr_1 a developer: {isinstance(mgr_1, Developer)}")
-
-# Using the issubclass() function
-print("\nUsing the issubclass() function")
-print(f"Employee, Employee: {issubclass(Employee, Employee)}")
-print(f"Manager, Employee: {issubclass(Manager, Employee)}")
-print(f"Manager, Manager: {issubclass(Manager, Manager)}")
-print(f"Manager, Developer: {issubclass(Manager, Developer)}")
-print(f"Employee, Manager: {issubclass(Employee, Manager)}")
-
-# Using the special methods in the Employee class
-print("\nUsing the special methods of the Employee class")
-print(f"__repr__ output: {repr(emp_1)}")
-print(f"__str__ output: {emp_1}")  # Output is the same as str(emp_1)
-
-# Using the class decorators to change emp_3's details
-print("\nJohn Doe's details")
-print(f"First: {emp_3.first}")
-print(f"Email: {emp_3.email}")
-print(f"Fullname: {emp_3.fullname()}")
-print("\nJohn Doe has decided to change his name.")
-emp_3.name_change = "Joe Bloggs"
-print(f"First: {emp_3.first}")
-print(f"Email: {emp_3.email}")
-print(f"Fullname: {emp_3.fullname()}")
+        """Method to print the supervisor's employees. map applies
+        attrgetter('fullname') to each employee, which still calls the Python
+        fullname property (usually returning its cached value). The generator
+        expression then formats one line per employee, and writelines writes
+        them all in a single call rather than calling print for each one.
+        """
+        fullnames = map(attrgetter('fullname'), self.employees.values())
+        sys.stdout.writelines("--> %s\n" % name for name in fullnames)
+
+
+class EmployeeTable:
+    """Stores many employees as a "struct of arrays". Rather than one Employee
+    object per person, with each person's first, last and pay scattered around
+    memory, there is one numpy array for each attribute. Working on every pay
+    at once then becomes a single numpy operation over one block of memory.
+
+    Employee is still the class to use for a single employee; EmployeeTable is
+    for working with a large number of them. It requires numpy.
+    """
 
+    __slots__ = ('first', 'last', 'pay', 'n')
+
+    def __init__(self, first, last, pay):
+        """first, last and pay are the columns of the table, one item per
+        employee, so they must all be the same length.
+        """
+        if np is None:
+            raise ImportError("EmployeeTable requires numpy")
+        self.first = np.asarray(first, dtype=str)
+        self.last = np.asarray(last, dtype=str)
+        self.pay = np.asarray(pay, dtype=np.int64)
+        self.n = len(self.pay)
+        if len(self.first) != self.n or len(self.last) != self.n:
+            raise ValueError("first, last and pay must be the same length")
+
+    @classmethod
+    def from_employees(cls, employees):
+        """An alternative constructor that copies a list of Employee objects
+        into the arrays in a single pass.
+        """
+        first, last, pay = [], [], []
+        for employee in employees:
+            first.append(employee.first)
+            last.append(employee.last)
+            pay.append(employee.pay)
+        return cls(first, last, pay)
+
+    def apply_raise(self, factor=None):
+        """Raises every pay in the table with one numpy operation. The table
+        doesn't record which class each employee came from, so every row gets
+        the same factor. If no factor is given, Employee.raise_amount is used
+        for every row, including any developers.
+        """
+        if factor is None:
+            factor = Employee.raise_amount
+        self.pay = (self.pay * factor).astype(np.int64)
+
+    def fullname_all(self):
+        """Returns an array of every employee's full name, joined by numpy."""
+        return np.char.add(np.char.add(self.first, ' '), self.last)
+
+
+def main():
+    """Runs the examples below. Keeping them in a function means importing
+    this file doesn't run them, and the variables inside are fast local
+    variables rather than module globals.
+    """
+    """Creating two instances of the Employee class"""
+    emp_1 = Employee("John", "Wick", 50000)
+    emp_2 = Employee("Test", "User", 60000)
+
+    """Printing the the raise amounts in different ways"""
+    print("Printing the raise amounts")
+    print(Employee.raise_amount)  # Using the Class to access a class variable
+    print(emp_1.raise_amount)  # Accessing the class variable from the instance
+    print(emp_2.raise_amount)
+
+    """Modifying a class variable using a class method"""
+    print("\nModifying the raise_amount class variable and printing to see "
+          "the results")
+    Employee.set_raise_amount(1.05)  # Changing the raise amount to 5%
+    # Printing in different ways to show the change
+    print(Employee.raise_amount)
+    print(emp_1.raise_amount)
+    print(emp_2.raise_amount)
+
+    """Using the alternative constructor to create a new instance of the
+    Employee class"""
+    print("\nUsing the alternative constructor to create new employees")
+    # Creating some employee details, separated by hyphens
+    emp_string_3 = "John-Doe-70000"
+    emp_string_4 = "Steve-Smith-30000"
+    emp_string_5 = "Jane-Doe-90000"
+
+    # Using the alternative constructor to create Employee classes
+    emp_3 = Employee.from_string(emp_string_3)
+    emp_4 = Employee.from_string(emp_string_4)
+    emp_5 = Employee.from_string(emp_string_5)
+
+    # Printing details
+    print(emp_3.email)
+    print(emp_3.pay)
+
+    """Using the static method to check if the provided date is a workday"""
+    example_date_1 = datetime.date(2022, 12, 7)  # Wednesday
+    example_date_2 = datetime.date(2022, 10, 15)  # Saturday
+
+    print("\nUsing the static method to check workdays")
+    print(f"7/12/2022 (Wednesday): {Employee.is_workday(example_date_1)}")
+    print(f"15/10/2022 (Saturday): {Employee.is_workday(example_date_2)}")
+
+    """Demonstrating the use of subclasses"""
+    # Creating an instance of the Developer class
+    dev_1 = Developer("Alan", "Turing", 100000, "Machine Language")
+    print("\nCreating a Developer subclass and demonstrating inheritance")
+    print(f"Email: {dev_1.email}")
+    print(f"Programming Language: {dev_1.prog_lang}")
+
+    # Using the subclass's attribute override, but using an inherited method
+    print("\nRaising pay using attribute override and method inheritance")
+    print(dev_1.pay)
+    dev_1.apply_raise()
+    print(dev_1.pay)
+
+    # Creating an instance of the Manager class
+    mgr_1 = Manager("Sue", "Smith", 90000, [emp_1, emp_2, emp_3])
+    print("\nCreating a Manager subclass and demonstrating inheritance")
+    print(f"Email: {mgr_1.email}")
+
+    # Testing the Manager class methods
+    print(f"\nTesting the class methods")
+    mgr_1.print_employees()
+    mgr_1.add_employee(dev_1)
+    print("\nAdd a Developer to the team")
+    mgr_1.print_employees()
+    print("\nRemove an employee from the team")
+    mgr_1.remove_employee(emp_1)
+    mgr_1.print_employees()
+
+    # Using the insintance() function
+    print("\nUsing the isinstance() function")
+    print(f"Is mgr_1 an employee: {isinstance(mgr_1, Employee)}")
+    print(f"Is mgr_1 a manager: {isinstance(mgr_1, Manager)}")
+    print(f"Is mgr_1 a developer: {isinstance(mgr_1, Developer)}")
+
+    # Using the issubclass() function
+    print("\nUsing the issubclass() function")
+    print(f"Employee, Employee: {issubclass(Employee, Employee)}")
+    print(f"Manager, Employee: {issubclass(Manager, Employee)}")
+    print(f"Manager, Manager: {issubclass(Manager, Manager)}")
+    print(f"Manager, Developer: {issubclass(Manager, Developer)}")
+    print(f"Employee, Manager: {issubclass(Employee, Manager)}")
+
+    # Using the special methods in the Employee class
+    print("\nUsing the special methods of the Employee class")
+    print(f"__repr__ output: {repr(emp_1)}")
+    print(f"__str__ output: {emp_1}")  # Output is the same as str(emp_1)
+
+    # Using the class decorators to change emp_3's details
+    print("\nJohn Doe's details")
+    print(f"First: {emp_3.first}")
+    print(f"Email: {emp_3.email}")
+    print(f"Fullname: {emp_3.fullname}")
+    print("\nJohn Doe has decided to change his name.")
+    emp_3.name_change = "Joe Bloggs"
+    print(f"First: {emp_3.first}")
+    print(f"Email: {emp_3.email}")
+    print(f"Fullname: {emp_3.fullname}")
+
+    # Using the bulk_create alternative constructor to create many developers
+    print("\nCreating developers in bulk")
+    print(f"Number of employees: {Employee.num_of_employees}")
+    devs = Developer.bulk_create([("Grace", "Hopper", 110000, "COBOL"),
+                                  ("Ada", "Lovelace", 120000, "Assembly")])
+    for dev in devs:
+        print(f"{dev} ({dev.prog_lang})")
+    print(f"Number of employees: {Employee.num_of_employees}")
+
+
+    # Using apply_raise_batch to give a list of employees a raise at once
+    print("\nGiving a mixed list of employees a raise with apply_raise_batch")
+    team = [emp_4, emp_5] + devs
+    print([employee.pay for employee in team])
+    Employee.apply_raise_batch(team)  # Each uses its own class's raise_amount
+    print([employee.pay for employee in team])
+
+    # Using an EmployeeTable to work on many employees at once
+    print("\nStoring employees in an EmployeeTable")
+    if np is None:
+        print("numpy isn't installed, so EmployeeTable can't be used")
+    else:
+        table = EmployeeTable.from_employees([emp_3, emp_4, emp_5])
+        print(table.fullname_all())
+        table.apply_raise()  # Everyone gets Employee.raise_amount
+        print(table.pay)
+
+if __name__ == "__main__":
+    main()